@@ -129,8 +129,7 @@
         const columnTypeDropdown = document.getElementById('columnType');
         if (columnTypeDropdown) {
             columnTypeDropdown.addEventListener('change', function() {
-                const config = getCurrentFormConfiguration();
-                updateColumnConfiguration(currentColumnIndex, config);
+                updateConfigurationFromForm(getCurrentFormConfiguration());
                 updateDropdownStates(); // Apply filtering based on new selection
             });
         }
@@ -139,8 +138,7 @@
         const periodDropdown = document.getElementById('period');
         if (periodDropdown) {
             periodDropdown.addEventListener('change', function() {
-                const config = getCurrentFormConfiguration();
-                updateColumnConfiguration(currentColumnIndex, config);
+                updateConfigurationFromForm(getCurrentFormConfiguration());
                 updateDropdownStates(); // Apply business rules and filtering
             });
         }
@@ -149,8 +147,7 @@
         const drcrDropdown = document.getElementById('drcr');
         if (drcrDropdown) {
             drcrDropdown.addEventListener('change', function() {
-                const config = getCurrentFormConfiguration();
-                updateColumnConfiguration(currentColumnIndex, config);
+                updateConfigurationFromForm(getCurrentFormConfiguration());
                 updateDropdownStates(); // Apply engagement filtering
             });
         }
@@ -169,7 +166,7 @@
                 // Update configuration
                 const config = getCurrentFormConfiguration();
                 config.engagement = engagement;
-                updateColumnConfiguration(currentColumnIndex, config);
+                updateConfigurationFromForm(config);
                 
                 // Apply filtering based on engagement selection
                 updateDropdownStates();
@@ -183,6 +180,20 @@
         });
     }
 
+    /**
+     * Store a form change for the current column. Change events that leave the
+     * stored configuration as it was (e.g. re-clicking the selected engagement)
+     * skip re-validation; saving always re-validates.
+     */
+    function updateConfigurationFromForm(config) {
+        const existing = getColumnConfiguration(currentColumnIndex);
+        if (Object.keys(config).every(key => existing[key] === config[key])) {
+            return;
+        }
+        
+        updateColumnConfiguration(currentColumnIndex, config);
+    }
+
     /**
      * Initialize dropdown states when dialog opens - SHOW ALL OPTIONS INITIALLY
      */
@@ -353,18 +364,21 @@
     function checkBusinessRules(config) {
         const errors = [];
         
+        if (!config.period || !config.balanceType) {
+            return errors;
+        }
+        
+        const isCurrentPeriod = config.period.toLowerCase().includes('current');
+        const isUnadjusted = config.balanceType.toLowerCase().includes('unadjusted');
+        
         // Rule: Current period = unadjusted only
-        if (config.period && config.period.toLowerCase().includes('current')) {
-            if (config.balanceType && !config.balanceType.toLowerCase().includes('unadjusted')) {
-                errors.push('Current Period can only be used with Unadjusted Balance types.');
-            }
+        if (isCurrentPeriod && !isUnadjusted) {
+            errors.push('Current Period can only be used with Unadjusted Balance types.');
         }
         
         // Rule: Prior periods = other balance types only
-        if (config.period && !config.period.toLowerCase().includes('current')) {
-            if (config.balanceType && config.balanceType.toLowerCase().includes('unadjusted')) {
-                errors.push('Prior periods cannot be used with Unadjusted Balance types.');
-            }
+        if (!isCurrentPeriod && isUnadjusted) {
+            errors.push('Prior periods cannot be used with Unadjusted Balance types.');
         }
         
         return errors;
@@ -404,6 +418,7 @@
         if (!periodDropdown) return;
         
         const selectedBalanceType = currentConfig.balanceType.toLowerCase();
+        const isUnadjusted = selectedBalanceType.includes('unadjusted');
         const options = periodDropdown.querySelectorAll('option');
         
         options.forEach(option => {
@@ -416,15 +431,17 @@
             option.style.color = '';
             option.title = '';
             
-            if (selectedBalanceType.includes('unadjusted')) {
+            if (option.value === '') return; // Placeholder option is always shown
+            
+            if (isUnadjusted) {
                 // Unadjusted: only allow current period
-                if (!value.includes('current') && !text.includes('current') && option.value !== '') {
+                if (!value.includes('current') && !text.includes('current')) {
                     option.style.display = 'none'; // Hide completely
                     option.title = 'Unadjusted Balance types can only use Current Period';
                 }
-            } else if (selectedBalanceType && selectedBalanceType !== '') {
+            } else if (selectedBalanceType) {
                 // Non-unadjusted: hide current period
-                if ((value.includes('current') || text.includes('current')) && option.value !== '') {
+                if (value.includes('current') || text.includes('current')) {
                     option.style.display = 'none'; // Hide completely
                     option.title = 'Current Period can only be used with Unadjusted Balance types';
                 }
@@ -441,6 +458,10 @@
         const periodDropdown = document.getElementById('period');
         if (!periodDropdown) return;
         
+        // Index the complete configurations of the other columns once, then test each option against it
+        const usedConfigurationKeys = new Set(getOtherCompleteConfigurations().map(otherConfig =>
+            generateConfigurationKey(otherConfig.engagement, otherConfig.balanceType, otherConfig.period, otherConfig.drCr)));
+        const drCr = currentConfig.drCr || 'dr'; // Use existing or default DR/CR
         const options = periodDropdown.querySelectorAll('option');
         
         options.forEach(option => {
@@ -448,48 +469,50 @@
             
             const testPeriod = option.value;
             
-            // Check if this period would create a conflict
-            const testConfig = {
-                ...currentConfig,
-                period: testPeriod,
-                drCr: currentConfig.drCr || 'dr' // Use existing or default DR/CR
-            };
-            
-            // Check against all existing configurations
-            let hasConflict = false;
-            for (const otherColumnIndex in window.columnConfigurations) {
-                const otherColNum = parseInt(otherColumnIndex);
-                if (otherColNum === currentColumnIndex) continue;
-                
-                const otherConfig = window.columnConfigurations[otherColumnIndex];
-                if (!otherConfig || !otherConfig.engagement || !otherConfig.balanceType || 
-                    !otherConfig.period || !otherConfig.drCr) {
-                    continue;
-                }
-                
-                // Check if this would create a duplicate
-                if (testConfig.engagement === otherConfig.engagement &&
-                    testConfig.balanceType === otherConfig.balanceType &&
-                    testConfig.period === otherConfig.period &&
-                    testConfig.drCr === otherConfig.drCr) {
-                    hasConflict = true;
-                    break;
-                }
-            }
-            
-            if (hasConflict) {
+            // Check if this period would create a duplicate
+            const testKey = generateConfigurationKey(currentConfig.engagement, currentConfig.balanceType, testPeriod, drCr);
+            if (usedConfigurationKeys.has(testKey)) {
                 option.style.display = 'none';
                 option.title = `Period ${testPeriod} already used for this engagement and balance type combination`;
             }
         });
     }
 
+    /**
+     * Get the complete configurations of every column other than the one being edited
+     */
+    function getOtherCompleteConfigurations() {
+        const otherConfigs = [];
+        
+        for (const otherColumnIndex in window.columnConfigurations) {
+            const otherColNum = parseInt(otherColumnIndex);
+            if (otherColNum === currentColumnIndex) continue;
+            
+            const otherConfig = window.columnConfigurations[otherColumnIndex];
+            if (!otherConfig || !otherConfig.engagement || !otherConfig.balanceType || 
+                !otherConfig.period || !otherConfig.drCr) {
+                continue;
+            }
+            
+            otherConfigs.push(otherConfig);
+        }
+        
+        return otherConfigs;
+    }
+
     /**
      * Filter engagement options that would create conflicts
      */
     function filterConflictingEngagements(currentConfig) {
         if (!window.columnConfigurations) return;
         
+        // Candidate periods depend only on the balance type, so resolve them once for all engagements
+        const allPeriods = getAllPeriodsForBalanceType(currentConfig.balanceType);
+        
+        // Collect engagement/balance type/period combinations already used by other columns
+        const usedPeriodKeys = new Set(getOtherCompleteConfigurations().map(otherConfig =>
+            `${otherConfig.engagement}|${otherConfig.balanceType}|${otherConfig.period}`));
+        
         // Get all engagement items
         const engagementItems = document.querySelectorAll('.engagement-item, [data-engagement]');
         
@@ -497,7 +520,9 @@
             const engagement = item.getAttribute('data-engagement') || item.textContent.trim();
             
             // Check if this engagement has any available periods for the current balance type
-            const availablePeriods = getAvailablePeriodsForEngagement(engagement, currentConfig.balanceType);
+            const availablePeriods = engagement
+                ? allPeriods.filter(period => !usedPeriodKeys.has(`${engagement}|${currentConfig.balanceType}|${period}`))
+                : [];
             
             if (availablePeriods.length === 0) {
                 // No available periods - hide this engagement
@@ -513,41 +538,6 @@
         });
     }
 
-    /**
-     * Get available periods for a specific engagement and balance type combination
-     */
-    function getAvailablePeriodsForEngagement(engagement, balanceType) {
-        if (!window.columnConfigurations || !engagement || !balanceType) return [];
-        
-        // Get all possible periods based on balance type
-        const allPeriods = getAllPeriodsForBalanceType(balanceType);
-        
-        // Filter out periods already used by this engagement + balance type combination
-        const availablePeriods = allPeriods.filter(period => {
-            // Check if this period is already used
-            for (const otherColumnIndex in window.columnConfigurations) {
-                const otherColNum = parseInt(otherColumnIndex);
-                if (otherColNum === currentColumnIndex) continue;
-                
-                const otherConfig = window.columnConfigurations[otherColumnIndex];
-                if (!otherConfig || !otherConfig.engagement || !otherConfig.balanceType || 
-                    !otherConfig.period || !otherConfig.drCr) {
-                    continue;
-                }
-                
-                // Check if this period is used by same engagement + balance type
-                if (engagement === otherConfig.engagement &&
-                    balanceType === otherConfig.balanceType &&
-                    period === otherConfig.period) {
-                    return false; // Period is already used
-                }
-            }
-            return true; // Period is available
-        });
-        
-        return availablePeriods;
-    }
-
     /**
      * Get all possible periods for a balance type (based on business rules)
      */
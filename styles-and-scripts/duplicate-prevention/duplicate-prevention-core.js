@@ -138,17 +138,21 @@ function checkBusinessRules(config) {
         return result; // Skip validation if incomplete
     }
     
+    // Normalize once; both rules compare against the same lowercased values
+    const period = config.period.toLowerCase();
+    const isUnadjusted = config.balanceType.toLowerCase().includes('unadjusted');
+    
     // Rule 1: Current period = unadjusted only
-    if (config.period.toLowerCase().includes('current')) {
-        if (!config.balanceType.toLowerCase().includes('unadjusted')) {
+    if (period.includes('current')) {
+        if (!isUnadjusted) {
             result.valid = false;
             result.violations.push('Current period selections must use unadjusted balance types only');
         }
     }
     
     // Rule 2: Prior periods = other balance types only (not unadjusted)
-    if (config.period.toLowerCase().includes('prior')) {
-        if (config.balanceType.toLowerCase().includes('unadjusted')) {
+    if (period.includes('prior')) {
+        if (isUnadjusted) {
             result.valid = false;
             result.violations.push('Prior period selections cannot use unadjusted balance types');
         }
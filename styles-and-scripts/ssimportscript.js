@@ -15,6 +15,14 @@
          */
         const configurationKeys = ['columnType', 'engagementId', 'period', 'drcr'];
         
+        /**
+         * Column types that carry a balance and therefore need an engagement,
+         * period and DR/CR selection
+         */
+        const balanceTypes = new Set(['unadjusted-balance', 'budget-balance', 'adjusted-budget-balance', 
+                            'adjusted-balance', 'report-balance', 'federal-tax-balance', 
+                            'state-tax-balance', 'other-balance', 'proposed-balance']);
+        
         /**
          * Generate a unique configuration key from column settings
          * @param {Object} config - Column configuration object
@@ -22,11 +30,7 @@
          */
         function generateConfigurationKey(config) {
             // Only include balance types in duplicate checking
-            const balanceTypes = ['unadjusted-balance', 'budget-balance', 'adjusted-budget-balance', 
-                                'adjusted-balance', 'report-balance', 'federal-tax-balance', 
-                                'state-tax-balance', 'other-balance', 'proposed-balance'];
-            
-            if (!balanceTypes.includes(config.columnType)) {
+            if (!balanceTypes.has(config.columnType)) {
                 return null; // Non-balance types don't need duplicate checking
             }
             
@@ -152,13 +156,19 @@
             { id: 46, label: 'Melbourne Subsidiary 2', structure: 'None', balance: 'Adjusted', clientName: 'Client 46', clientNumber: '1984', engagementName: 'Leaf Engagement 46', parentId: 22, level: 5, displayOrder: 2 }
         ];
 
+        // IDs of every engagement that is the parent of another, built once from consolidationData
+        const parentEngagementIds = new Set(consolidationData.map(engagement => engagement.parentId));
+
+        // Engagement lookup by ID, built once from consolidationData
+        const engagementsById = new Map(consolidationData.map(engagement => [engagement.id, engagement]));
+
         // Current column being edited
         let currentColumn = null;
         let selectedEngagementId = null;
 
         // Function to determine if an engagement has children
         function hasChildren(engagementId) {
-            return consolidationData.some(engagement => engagement.parentId === engagementId);
+            return parentEngagementIds.has(engagementId);
         }
 
         // Get only true leaf engagements (structure: 'None' AND no children)
@@ -178,6 +188,9 @@
             
             console.log('True leaf engagements:', trueLeafEngagements.map(e => e.label));
             
+            // Build the items off-document and attach them in a single insertion
+            const fragment = document.createDocumentFragment();
+            
             trueLeafEngagements.forEach(engagement => {
                 const itemDiv = document.createElement('div');
                 itemDiv.className = 'engagement-item';
@@ -200,8 +213,10 @@
                     document.getElementById('engagementDropdownMenu').classList.remove('show');
                 });
                 
-                container.appendChild(itemDiv);
+                fragment.appendChild(itemDiv);
             });
+            
+            container.appendChild(fragment);
         }
 
         // Toggle engagement dropdown
@@ -218,11 +233,7 @@
             const drcrGroup = document.getElementById('drcrGroup');
 
             // Show engagement selection only for balance types
-            const balanceTypes = ['unadjusted-balance', 'budget-balance', 'adjusted-budget-balance', 
-                                'adjusted-balance', 'report-balance', 'federal-tax-balance', 
-                                'state-tax-balance', 'other-balance', 'proposed-balance'];
-            
-            if (balanceTypes.includes(columnType)) {
+            if (balanceTypes.has(columnType)) {
                 engagementGroup.style.display = 'block';
                 periodGroup.style.display = 'block';
                 drcrGroup.style.display = 'block';
@@ -273,11 +284,7 @@
             }
 
             // Check if engagement is required and selected
-            const balanceTypes = ['unadjusted-balance', 'budget-balance', 'adjusted-budget-balance', 
-                                'adjusted-balance', 'report-balance', 'federal-tax-balance', 
-                                'state-tax-balance', 'other-balance', 'proposed-balance'];
-            
-            if (balanceTypes.includes(columnType) && !selectedEngagementId) {
+            if (balanceTypes.has(columnType) && !selectedEngagementId) {
                 alert('Please select a target engagement for balance columns');
                 return;
             }
@@ -314,7 +321,7 @@
             let headerText = getColumnTypeDisplayName(columnType);
             
             if (engagementId) {
-                const engagement = consolidationData.find(e => e.id === engagementId);
+                const engagement = engagementsById.get(engagementId);
                 if (engagement) {
                     const periodText = getPeriodDisplayText(period);
                     headerCell.innerHTML = `
@@ -332,23 +339,25 @@
             }
         }
 
+        // Display names for column types
+        const columnTypeDisplayNames = {
+            'not-used': 'Not Used',
+            'account-grouping': 'Account Grouping',
+            'tax-information': 'Tax Information',
+            'unadjusted-balance': 'Unadjusted Balance',
+            'budget-balance': 'Budget Balance',
+            'adjusted-budget-balance': 'Adjusted Budget Balance',
+            'adjusted-balance': 'Adjusted Balance',
+            'report-balance': 'Report Balance',
+            'federal-tax-balance': 'Federal Tax Balance',
+            'state-tax-balance': 'State Tax Balance',
+            'other-balance': 'Other Balance',
+            'proposed-balance': 'Proposed Balance'
+        };
+
         // Get display name for column type
         function getColumnTypeDisplayName(columnType) {
-            const displayNames = {
-                'not-used': 'Not Used',
-                'account-grouping': 'Account Grouping',
-                'tax-information': 'Tax Information',
-                'unadjusted-balance': 'Unadjusted Balance',
-                'budget-balance': 'Budget Balance',
-                'adjusted-budget-balance': 'Adjusted Budget Balance',
-                'adjusted-balance': 'Adjusted Balance',
-                'report-balance': 'Report Balance',
-                'federal-tax-balance': 'Federal Tax Balance',
-                'state-tax-balance': 'State Tax Balance',
-                'other-balance': 'Other Balance',
-                'proposed-balance': 'Proposed Balance'
-            };
-            return displayNames[columnType] || columnType;
+            return columnTypeDisplayNames[columnType] || columnType;
         }
 
         // Close dropdowns when clicking outside